@@ -16,14 +16,21 @@ IP address is required while snmp community, port and version are optional.
 
 
 from __future__ import annotations
-from datetime import timedelta
+from array import array
+from concurrent.futures import ThreadPoolExecutor
+import json
 import logging
-from typing import List
-
-from easysnmp import Session
+import os
+import time
+from types import MappingProxyType
+from typing import Dict, List, Tuple
 
 from . import snmp
 from . import helpers
+from . import pool
+
+
+logger = logging.getLogger(__name__)
 
 
 class NetDevice:
@@ -36,81 +43,148 @@ class NetDevice:
     # speed x 1000000
     __COEFFICIENT = 1000000
     # Supported SNMP versions
-    __VERSIONS = (1, 2)
-    # SNMP default parameters
-    __DEFAULT = {
+    __VERSIONS = frozenset((1, 2))
+    # SNMP default parameters (read-only view)
+    __DEFAULT = MappingProxyType({
         "ADDRESS": "127.0.0.1",
         "COMMUNITY": "public",
         "PORT": 161,
-        "VERSION": 2
-    }
+        "VERSION": 2,
+        # Seconds to wait for a response before retrying the request
+        "TIMEOUT": 1,
+        # Number of times the request is retried after a timeout
+        "RETRIES": 1
+    })
     # Delimiters allowed in mac address
-    __DELIMITERS = (":", "-", ".")
+    __DELIMITERS = frozenset((":", "-", "."))
+    # Interface data saved on disk is considered fresh for 24 hours
+    __CACHE_TTL = 86400
+    # Maximum number of OIDs in a single GET request
+    __MAX_OIDS = 60
+
+    # Instances keep attributes in slots instead of __dict__
+    # which saves memory when there are many devices
+    __slots__ = (
+        "__address",
+        "__autoupdate",
+        "__cachedir",
+        "__cachetime",
+        "__community",
+        "__contact",
+        "__denseindexes",
+        "__description",
+        "__disconnected",
+        "__indexes",
+        "__indexes_set",
+        "__location",
+        "__name",
+        "__number",
+        "__port",
+        "__repeat",
+        "__repetitions",
+        "__responses",
+        "__retries",
+        "__session",
+        "__timeout",
+        "__types",
+        "__updatetime",
+        "__uptime",
+        "__version"
+    )
 
     def __init__(
             self,
             address=__DEFAULT["ADDRESS"],
             community=__DEFAULT["COMMUNITY"],
             port=__DEFAULT["PORT"],
-            version=__DEFAULT["VERSION"]) -> None:
+            version=__DEFAULT["VERSION"],
+            timeout=__DEFAULT["TIMEOUT"],
+            retries=__DEFAULT["RETRIES"]) -> None:
         """
         Class constructor.
 
+        Timeout and retries bound the time a request to an unreachable
+        device blocks the caller: at most timeout x (retries + 1) seconds.
+
         params:
             | address: {str} - device ip address
             | community: {str} - snmp community {default: "public"}
             | port: {int} - snmp port {default: 161}
             | version: {int} - snmp version {default: 2}
+            | timeout: {float} - seconds to wait for response {default: 1}
+            | retries: {int} - number of retries on timeout {default: 1}
         """
 
+        default = NetDevice.__DEFAULT
         # Ip address must be set and have an appropriate format
-        if not address.strip() or not helpers.is_ip_address(address):
-            address = NetDevice.__DEFAULT["ADDRESS"]
+        if helpers.is_ip_address(address):
+            address = address.strip()
+        else:
+            address = default["ADDRESS"]
         self.__address = address
         # Community must be set
-        if not community.strip():
-            community = NetDevice.__DEFAULT["COMMUNITY"]
+        if isinstance(community, str) and community.strip():
+            community = community.strip()
+        else:
+            community = default["COMMUNITY"]
         self.__community = community
         # Port must be set and have value between 1 and 65535
         if not helpers.is_port_number(port):
-            port = NetDevice.__DEFAULT["PORT"]
+            port = default["PORT"]
         self.__port = port
         # Version must be set and be one of supported
-        if version not in NetDevice.__VERSIONS:
-            version = NetDevice.__DEFAULT["VERSION"]
+        if not (
+            isinstance(version, int) and
+            version in NetDevice.__VERSIONS
+        ):
+            version = default["VERSION"]
         self.__version = version
+        # Timeout must be positive and retries must not be negative
+        if not helpers.is_timeout(timeout):
+            timeout = default["TIMEOUT"]
+        self.__timeout = timeout
+        if not helpers.is_retries_number(retries):
+            retries = default["RETRIES"]
+        self.__retries = retries
         self.__autoupdate = False
+        # Interface data is not saved on disk unless directory is set
+        self.__cachedir = ""
+        # Interface values are reused for 100 milliseconds
+        self.__cachetime = 0.1
         self.__contact = ""
+        # Interface indexes are walked unless they are known to be 1..number
+        self.__denseindexes = False
         self.__description = ""
+        # Set by disconnect, so getters do not connect the device again
+        self.__disconnected = False
         self.__indexes = []
+        # Same indexes for constant time membership checks
+        self.__indexes_set = frozenset()
         self.__location = ""
         self.__name = ""
         self.__number = 0
         self.__repeat = None
+        # Each GETBULK request asks for up to 25 rows of a column
+        self.__repetitions = 25
+        self.__responses = {}
         self.__session = None
         self.__types = []
-        # Each 60 seconds device related data will be populated
+        # Each 60 seconds uptime and interfaces will be updated
         self.__updatetime = 60
-        self.__uptime = ""
+        # Uptime in hundredths of a second, formatted only when read
+        self.__uptime = None
 
     def __str__(self) -> str:
         """
         Returns information about object in human readable format.
         """
 
-        TEMPLATE = (
-            "Name:          {0}\n"
-            "Address:       {1}\n"
-            "Port:          {2}\n"
-            "Community:     {3}\n"
-            "Version:       {4}\n"
-        )
-        return TEMPLATE.format(
-            self.__name,
-            self.__address,
-            str(self.__port),
-            self.__community,
-            str(self.__version)
+        return (
+            f"Name:          {self.__name}\n"
+            f"Address:       {self.__address}\n"
+            f"Port:          {self.__port}\n"
+            f"Community:     {self.__community}\n"
+            f"Version:       {self.__version}\n"
         )
 
     # ---------------------------------------
@@ -125,9 +199,10 @@ class NetDevice:
     @address.setter
     def address(self, new_value: str) -> None:
         if helpers.is_ip_address(new_value):
-            self.__address = new_value
+            self.__address = new_value.strip()
+            self.__release_session()
         else:
-            logging.error("IP address is empty or has an incorrect format.")
+            logger.error("IP address is empty or has an incorrect format.")
 
     @property
     def community(self) -> str:
@@ -137,7 +212,11 @@ class NetDevice:
 
     @community.setter
     def community(self, new_value: str) -> None:
-        self.__community = new_value
+        if isinstance(new_value, str) and new_value.strip():
+            self.__community = new_value.strip()
+            self.__release_session()
+        else:
+            logger.error("SNMP community can not be empty.")
 
     @property
     def port(self) -> int:
@@ -148,9 +227,10 @@ class NetDevice:
     @port.setter
     def port(self, new_value: int) -> None:
         if helpers.is_port_number(new_value):
-            self.__version = new_value
+            self.__port = new_value
+            self.__release_session()
         else:
-            logging.error("Port number is out of range.")
+            logger.error("Port number is out of range.")
 
     @property
     def version(self) -> int:
@@ -160,10 +240,42 @@ class NetDevice:
 
     @version.setter
     def version(self, new_value: int) -> None:
-        if new_value in NetDevice.__VERSIONS:
+        if (
+            isinstance(new_value, int) and
+            new_value in NetDevice.__VERSIONS
+        ):
             self.__version = new_value
+            self.__release_session()
+        else:
+            logger.error("Incorrect format or unsupported version of snmp.")
+
+    @property
+    def timeout(self) -> float:
+        """Seconds to wait for response before retrying request"""
+
+        return self.__timeout
+
+    @timeout.setter
+    def timeout(self, new_value: float) -> None:
+        if helpers.is_timeout(new_value):
+            self.__timeout = new_value
+            self.__release_session()
         else:
-            logging.error("Incorrect format or unsupported version of snmp.")
+            logger.error("Timeout must be a positive number of seconds.")
+
+    @property
+    def retries(self) -> int:
+        """Number of times request is retried after timeout"""
+
+        return self.__retries
+
+    @retries.setter
+    def retries(self, new_value: int) -> None:
+        if helpers.is_retries_number(new_value):
+            self.__retries = new_value
+            self.__release_session()
+        else:
+            logger.error("Number of retries can not be negative.")
 
     @property
     def autoupdate(self) -> bool:
@@ -176,12 +288,55 @@ class NetDevice:
         self.__autoupdate = new_value
         self.__change_autoupdate()
 
+    @property
+    def cachedir(self) -> str:
+        """Directory to keep interface data between connections in"""
+
+        return self.__cachedir
+
+    @cachedir.setter
+    def cachedir(self, new_value: str) -> None:
+        if isinstance(new_value, str):
+            self.__cachedir = os.path.expanduser(new_value)
+        else:
+            logger.error("Cache directory must be a string.")
+
+    @property
+    def cachetime(self) -> float:
+        """Time in seconds to reuse received interface values for"""
+
+        return self.__cachetime
+
+    @cachetime.setter
+    def cachetime(self, new_value: float) -> None:
+        if (
+            isinstance(new_value, (int, float)) and
+            not isinstance(new_value, bool) and
+            new_value >= 0
+        ):
+            self.__cachetime = new_value
+        else:
+            logger.error("Cache time must be a non-negative number.")
+
     @property
     def contact(self) -> str:
         """Contact"""
 
         return self.__contact
 
+    @property
+    def denseindexes(self) -> bool:
+        """Assume interface indexes are 1..number instead of walking them"""
+
+        return self.__denseindexes
+
+    @denseindexes.setter
+    def denseindexes(self, new_value: bool) -> None:
+        if isinstance(new_value, bool):
+            self.__denseindexes = new_value
+        else:
+            logger.error("Dense indexes flag must be True or False.")
+
     @property
     def description(self) -> str:
         """Description"""
@@ -210,6 +365,23 @@ class NetDevice:
     def number(self) -> int:
         return self.__number
 
+    @property
+    def repetitions(self) -> int:
+        """Number of rows requested by each GETBULK request"""
+
+        return self.__repetitions
+
+    @repetitions.setter
+    def repetitions(self, new_value: int) -> None:
+        if (
+            isinstance(new_value, int) and
+            not isinstance(new_value, bool) and
+            new_value > 0
+        ):
+            self.__repetitions = new_value
+        else:
+            logger.error("Number of repetitions must be positive.")
+
     @property
     def types(self) -> List[str]:
         """List of interface types"""
@@ -224,14 +396,23 @@ class NetDevice:
 
     @updatetime.setter
     def updatetime(self, new_value: int) -> None:
-        self.__updatetime = new_value
-        self.__change_autoupdate()
+        if (
+            isinstance(new_value, (int, float)) and
+            not isinstance(new_value, bool) and
+            new_value > 0
+        ):
+            self.__updatetime = new_value
+            self.__change_autoupdate()
+        else:
+            logger.error("Update time must be a positive number of seconds.")
 
     @property
     def uptime(self) -> str:
         """Uptime"""
 
-        return self.__uptime
+        if self.__uptime is None:
+            return ""
+        return helpers.get_time_from_ticks(self.__uptime)
 
     # ----------------------------------
     # Public methods declaration section
@@ -240,32 +421,87 @@ class NetDevice:
         """
         Initiates connection with the device
         using parameters passed in constructor.
+
+        Calling it is optional: the first interface getter called
+        connects to the device. Device objects are meant to be long-lived,
+        so the session is kept until disconnect. After disconnect only
+        this method connects the device again.
+
+        While the device does not respond, every getter tries to connect
+        and blocks for up to timeout x (retries + 1) seconds per request.
+
+        SNMP session is taken from the shared pool once and reused by
+        subsequent calls until one of the connection parameters is changed
+        or the device is disconnected.
+
+        If cachedir is set, interface indexes and types saved by
+        previous connections are used instead of walking the device.
         """
 
+        self.__disconnected = False
         try:
-            self.__session = Session(
-                hostname=self.__address,
-                community=self.__community,
-                remote_port=self.__port,
-                version=self.__version
-            )
-            self.__populate()
-            return True
+            if self.__session is None:
+                self.__session = pool.SESSIONS.acquire(
+                    hostname=self.__address,
+                    community=self.__community,
+                    remote_port=self.__port,
+                    version=self.__version,
+                    timeout=self.__timeout,
+                    retries=self.__retries,
+                    # All OIDs used are numeric, so responses
+                    # are not translated to MIB names either
+                    use_numeric=True,
+                    # Values are returned raw, without net-snmp
+                    # formatting them with MIB definitions
+                    use_sprint_value=False
+                )
+            if self.__populate(cached=True):
+                return True
         except Exception as err:
-            logging.error("Could not connect to device.")
-            logging.error(err)
+            logger.error(
+                "Could not connect to device %s: %s", self.__address, err
+            )
+        # Next connect opens a new session instead of the failed one
+        self.__release_session(healthy=False)
+        return False
+
+    @staticmethod
+    def connect_many(
+        devices: List[NetDevice],
+        workers: int = 16
+    ) -> List[bool]:
+        """
+        Initiates connection with several devices concurrently.
+
+        Devices are connected from a pool of worker threads, so the total
+        time is close to the slowest device instead of the sum of all.
+
+        params:
+            | devices: {List[NetDevice]} - devices to connect
+            | workers: {int} - maximum number of threads {default: 16}
+        """
+
+        with ThreadPoolExecutor(max_workers=workers) as executor:
+            return list(executor.map(NetDevice.connect, devices))
 
     def disconnect(self) -> None:
         """
         Correctly drops connection with the device.
+
+        Autoupdate is stopped and SNMP session is returned to the shared
+        pool to be reused by the next device connecting with the same
+        parameters. Getters and refresh called afterwards return no data
+        instead of connecting the device until connect is called.
         """
 
-        try:
+        self.__autoupdate = False
+        self.__disconnected = True
+        if self.__repeat is not None:
             self.__repeat.cancel()
-            self.__repeat = None
-        except Exception as err:
-            logging.error("Could not disconnect device.")
-            logging.error(err)
+        # Job is kept until the session is released, so the session
+        # is not pooled while the last update is still running
+        self.__release_session()
+        self.__repeat = None
 
     def get_if_admin_status(self, port: int) -> str:
         """
@@ -283,7 +519,100 @@ class NetDevice:
             port,
             "Could not get interface admin status."
         )
-        return snmp.IF_ADMIN_STATES[value]
+        return snmp.IF_ADMIN_STATES.get(value, "unknown")
+
+    def get_if_admin_statuses(self) -> Dict[int, str]:
+        """
+        The desired states of all interfaces of the device keyed by
+        interface number. The whole ifAdminStatus column is received with
+        GETBULK requests instead of one request per interface.
+        """
+
+        values = self.__get_if_column(
+            "IF_ADMIN_STATUS",
+            "Could not get interface admin statuses."
+        )
+        return {
+            port: snmp.IF_ADMIN_STATES.get(value, "unknown")
+            for port, value in values.items()
+        }
+
+    def get_if_bulk(self, ports: List[int], field: str) -> Dict[int, str]:
+        """
+        Values of the given interface field (key of snmp.OIDS, e.g.
+        "IF_IN_OCTETS") for the given interfaces keyed by interface number.
+
+        Values of up to 60 interfaces are received with a single request
+        instead of one request per interface. Unknown interfaces are
+        skipped.
+        """
+
+        result = {}
+        if field not in snmp.OIDS:
+            logger.error("Unknown interface field %s.", field)
+            return result
+        if not self.__ensure_connected():
+            return result
+        # Attribute lookups are done once instead of once per interface
+        indexes = self.__indexes_set
+        get_if_oid = snmp.get_if_oid
+        ports = [port for port in ports if port in indexes]
+        if not ports:
+            logger.error(
+                "No interface or given interface numbers are incorrect."
+            )
+            return result
+        oids = [get_if_oid(field, port) for port in ports]
+        try:
+            snmp_data = self.__get_many(oids)
+        except Exception as err:
+            logger.error("Could not get %s of interfaces. %s", field, err)
+        else:
+            received = time.monotonic()
+            responses = self.__responses
+            for port, oid, variable in zip(ports, oids, snmp_data):
+                value = variable.value
+                result[port] = value
+                responses[oid] = (received, value)
+        return result
+
+    def get_if_counters(self, fields: List[str]) -> Dict[str, array]:
+        """
+        Values of the given counter fields (keys of snmp.OIDS, e.g.
+        "IF_IN_OCTETS") for all interfaces keyed by field.
+
+        Each field is received with a single walk of its column and
+        returned as an array of unsigned 64 bit integers in the order of
+        indexes, so sums and averages run over contiguous memory.
+        Interfaces without a numeric value get 0. Fields which are unknown
+        or could not be received are left out of the result.
+        """
+
+        result = {}
+        if not self.__ensure_connected():
+            return result
+        indexes = self.__indexes
+        for field in fields:
+            # Unknown field is skipped instead of returning a column of zeros
+            if field not in snmp.OIDS:
+                logger.error("Unknown interface field %s.", field)
+                continue
+            values = self.__get_if_column(
+                field,
+                "Could not get %s column of interface table.",
+                field
+            )
+            # Column which could not be received is skipped as well
+            if indexes and not values:
+                continue
+            column = array("Q", [0]) * len(indexes)
+            for position, port in enumerate(indexes):
+                try:
+                    column[position] = int(values[port])
+                except (KeyError, ValueError, OverflowError):
+                    pass
+            result[field] = column
+        return result
 
     def get_if_description(self, port: int) -> str:
         """
@@ -298,6 +627,18 @@ class NetDevice:
             "Could not get interface description."
         )
 
+    def get_if_descriptions(self) -> Dict[int, str]:
+        """
+        Descriptions of all interfaces of the device keyed by interface
+        number. The whole ifDescr column is received with GETBULK requests
+        instead of one request per interface.
+        """
+
+        return self.__get_if_column(
+            "IF_DESCRIPTION",
+            "Could not get interface descriptions."
+        )
+
     def get_if_in_octets(self, port: int) -> str:
         """
         The total number of octets received on the interface,
@@ -406,11 +747,16 @@ class NetDevice:
         value = self.__get_if_data(
             "IF_LAST_CHANGE",
             port,
-            "Could not get last change time of port number {}.".format(
-                str(port)
-            )
+            "Could not get last change time of port number %d.",
+            port
         )
-        return str(timedelta(seconds=(int(value)) / 100))
+        # Value is None if the request has failed and it is already logged
+        if value is None:
+            return None
+        try:
+            return helpers.get_time_from_ticks(int(value))
+        except (TypeError, ValueError):
+            logger.error("Last change time is not in digital format.")
 
     def get_if_mtu(self, port: int) -> str:
         """
@@ -423,11 +769,20 @@ class NetDevice:
         return self.__get_if_data(
             "IF_MTU",
             port,
-            "Could not get mtu value of port number {}.".format(
-                str(port)
-            )
+            "Could not get mtu value of port number %d.",
+            port
         )
 
+    def get_if_octets(self, port: int) -> Tuple[str, str]:
+        """
+        The total number of octets received on and transmitted out of the
+        interface, including framing characters. Both counters are requested
+        in a single SNMP packet, so the pair is taken at the same moment.
+        """
+
+        result = self.get_if_stats(port, ["IF_IN_OCTETS", "IF_OUT_OCTETS"])
+        return (result["IF_IN_OCTETS"], result["IF_OUT_OCTETS"])
+
     def get_if_oper_status(self, port: int) -> str:
         """
         The current operational state of the interface. The testing(3) state
@@ -448,7 +803,7 @@ class NetDevice:
             port,
             "Could not get interface operation status."
         )
-        return snmp.IF_OPER_STATES[value]
+        return snmp.IF_OPER_STATES.get(value, "unknown")
 
     def get_if_out_octets(self, port: int) -> str:
         """
@@ -558,35 +913,19 @@ class NetDevice:
         """
 
         result = ""
-        if self.__number > 0 and port in self.__indexes:
-            if delimiter in NetDevice.__DELIMITERS:
-                try:
-                    snmp_data = self.__session.get(
-                        snmp.OIDS["IF_PHYS_ADDRESS"] + str(port)
-                    )
-                except Exception as err:
-                    logging.error(
-                        "Could not get physical address of the interface."
-                    )
-                    logging.error(err)
-                else:
-                    value = snmp_data.value.strip()
-                    if value:
-                        result = helpers.get_mac_from_octets(
-                            value, delimiter
-                        )
-                    else:
-                        logging.error(
-                            "Interface has no physical address."
-                        )
-            else:
-                logging.error(
-                    "Invalid delimiter for physical address."
-                )
-        else:
-            logging.error(
-                "No interface or given interface number is incorrect."
-            )
+        if delimiter not in NetDevice.__DELIMITERS:
+            logger.error("Invalid delimiter for physical address.")
+            return result
+        value = self.__get_if_data(
+            "IF_PHYS_ADDRESS",
+            port,
+            "Could not get physical address of the interface."
+        )
+        # Value is None if the request has failed
+        if value:
+            result = helpers.get_mac_from_octets(value, delimiter)
+        elif value is not None:
+            logger.error("Interface has no physical address.")
         return result
 
     def get_if_speed(self, port: int) -> str:
@@ -601,15 +940,71 @@ class NetDevice:
         bandwidth, this object should be zero.
         """
 
+        result = self.get_if_speed_bps(port)
+        if result is None:
+            return None
+        if result > NetDevice.__COEFFICIENT:
+            result //= NetDevice.__COEFFICIENT
+        return str(result)
+
+    def get_if_speed_bps(self, port: int) -> int:
+        """
+        Interface speed in bits per second as a number.
+
+        Use it instead of get_if_speed when the value
+        is used in calculations rather than displayed.
+        """
+
         value = self.__get_if_data(
             "IF_SPEED",
             port,
             "Could not get interface speed."
         )
-        result = int(value)
-        if result > NetDevice.__COEFFICIENT:
-            result = int(result / NetDevice.__COEFFICIENT)
-        return str(result)
+        # Value is None if the request has failed and it is already logged
+        if value is None:
+            return None
+        try:
+            return int(value)
+        except (TypeError, ValueError):
+            logger.error("Interface speed is not in digital format.")
+
+    def get_if_stats(self, port: int, fields: List[str]) -> Dict[str, str]:
+        """
+        Values of the given fields (keys of snmp.OIDS, e.g. "IF_MTU")
+        of the interface keyed by field.
+
+        All fields are received with a single request instead of one
+        request per field. Received values are also returned by the other
+        get_if_* methods for cachetime seconds.
+        """
+
+        values = self.__get_if_values(
+            fields,
+            port,
+            "Could not get statistics of the interface."
+        )
+        return dict(zip(fields, values))
+
+    def get_if_table(self, fields: List[str]) -> Dict[int, Dict[str, str]]:
+        """
+        Values of the given interface fields (keys of snmp.OIDS, e.g.
+        "IF_IN_OCTETS") for all interfaces keyed by interface number.
+
+        Each field is received with a single walk of its column instead of
+        one request per interface. Received values are also returned by
+        the other get_if_* methods for cachetime seconds.
+        """
+
+        result = {}
+        for field in fields:
+            values = self.__get_if_column(
+                field,
+                "Could not get %s column of interface table.",
+                field
+            )
+            for port, value in values.items():
+                result.setdefault(port, {})[field] = value
+        return result
 
     def get_if_type(self, port: int) -> str:
         """
@@ -623,7 +1018,7 @@ class NetDevice:
             port,
             "Could not get interface type."
         )
-        return snmp.IF_TYPES[value]
+        return snmp.IF_TYPES.get(value, "unknown")
 
     def get_if_unknown_protos(self, port: int) -> str:
         """
@@ -642,6 +1037,39 @@ class NetDevice:
             "Could not get number of packets with unknown protocols."
         )
 
+    def refresh(self) -> bool:
+        """
+        Populates device fields with the data
+        received from the device, ignoring saved interface data.
+
+        Device which is not connected yet is connected first, unless
+        it was disconnected. Returns False if the device data could
+        not be received.
+        """
+
+        if not self.__ensure_connected():
+            return False
+        return self.__populate()
+
+    @staticmethod
+    def refresh_many(
+        devices: List[NetDevice],
+        workers: int = 16
+    ) -> List[bool]:
+        """
+        Populates fields of several devices concurrently.
+
+        Devices are refreshed from a pool of worker threads, so the total
+        time is close to the slowest device instead of the sum of all.
+
+        params:
+            | devices: {List[NetDevice]} - devices to refresh
+            | workers: {int} - maximum number of threads {default: 16}
+        """
+
+        with ThreadPoolExecutor(max_workers=workers) as executor:
+            return list(executor.map(NetDevice.refresh, devices))
+
     # -----------------------------------
     # Рrivate methods declaration section
     # -----------------------------------
@@ -650,165 +1078,417 @@ class NetDevice:
         Function activates/deactivates autoupdate functionality.
         """
 
+        if self.__repeat is not None:
+            self.__repeat.cancel()
+            self.__repeat = None
+        # Updates of all devices are scheduled by the shared scheduler
+        # instead of each device running its own thread
         if self.__autoupdate:
-            self.__repeat = helpers.SetInterval(
-                self.__populate,
+            self.__repeat = helpers.SCHEDULER.add(
+                self.__update,
                 self.__updatetime
             )
-        elif self.__repeat is not None:
-            self.__repeat.cancel()
-            self.__repeat = None
-
-    def __get_contact(self) -> str:
-        """
-        The textual identification of the contact person for this managed node,
-        together with information on how to contact this person.
-        """
-
-        return self.__get_sys_data(
-            "SYS_CONTACT",
-            "Could not get device contact."
-        )
 
-    def __get_description(self) -> str:
+    def __get_cache_path(self) -> str:
         """
-        A textual description of the entity. This value should include the full
-        name and version identification of the system's hardware type, software
-        operating-system, and networking software. It is mandatory that this
-        only contain printable ASCII characters.
+        Returns path of the file with saved interface data of the device.
         """
 
-        return self.__get_sys_data(
-            "SYS_DECRIPTION",
-            "Could not get device description."
+        return os.path.join(
+            self.__cachedir,
+            "{0}_{1}.json".format(self.__address, str(self.__port))
         )
 
     def __get_if_data(
         self,
         snmp_oid: str,
         if_port: int,
-        error_msg: str
+        error_msg: str,
+        *error_args
     ) -> str:
         """
         Function used in receiving interface related information.
-        """
 
-        if self.__number > 0 and if_port in self.__indexes:
+        Value received less than cachetime seconds ago
+        is returned without sending a new request.
+
+        Error message is formatted with error_args by logger
+        only when the request fails.
+        """
+
+        if (
+            self.__ensure_connected() and
+            self.__number > 0 and
+            if_port in self.__indexes_set
+        ):
+            oid = snmp.get_if_oid(snmp_oid, if_port)
+            response = self.__responses.get(oid)
+            if (
+                response is not None and
+                time.monotonic() - response[0] < self.__cachetime
+            ):
+                return response[1]
             try:
-                snmp_data = self.__session.get(
-                    snmp.OIDS[snmp_oid] + str(if_port)
-                )
+                snmp_data = self.__session.get(oid)
             except Exception as err:
-                logging.error(error_msg)
-                logging.error(err)
+                logger.error(error_msg + " %s", *error_args, err)
             else:
+                self.__responses[oid] = (time.monotonic(), snmp_data.value)
                 return snmp_data.value
         else:
-            logging.error(
+            logger.error(
                 "No interface or given interface number is incorrect."
             )
 
-    def __get_if_indexes(self) -> List[int]:
+    def __get_if_column(
+        self,
+        snmp_oid: str,
+        error_msg: str,
+        *error_args
+    ) -> Dict[int, str]:
+        """
+        Function used in receiving interface related information
+        for all interfaces at once.
+
+        Returns dictionary of values keyed by interface number.
+
+        SNMP v2 devices are walked with GETBULK requests,
+        SNMP v1 devices with GETNEXT ones.
+        """
+
+        result = {}
+        if snmp_oid not in snmp.OIDS:
+            logger.error("Unknown interface field %s.", snmp_oid)
+            return result
+        if not self.__ensure_connected():
+            return result
+        prefix = snmp.OIDS[snmp_oid]
+        try:
+            snmp_data = self.__walk(prefix.rstrip("."))
+        except Exception as err:
+            logger.error(error_msg + " %s", *error_args, err)
+        else:
+            # Received values are reused by __get_if_data as well
+            received = time.monotonic()
+            # Attribute lookups are done once for the whole column
+            responses = self.__responses
+            for variable in snmp_data:
+                index, value = variable.oid_index, variable.value
+                result[int(index)] = value
+                responses[prefix + index] = (received, value)
+        return result
+
+    def __get_if_values(
+        self,
+        snmp_oids: List[str],
+        if_port: int,
+        error_msg: str
+    ) -> List[str]:
+        """
+        Function used in receiving several interface related values
+        with a single request.
+
+        Received values are reused by __get_if_data as well.
+        """
+
+        result = [None] * len(snmp_oids)
+        unknown = [
+            snmp_oid for snmp_oid in snmp_oids if snmp_oid not in snmp.OIDS
+        ]
+        if unknown:
+            logger.error("Unknown interface fields %s.", ", ".join(unknown))
+        elif (
+            self.__ensure_connected() and
+            self.__number > 0 and
+            if_port in self.__indexes_set
+        ):
+            oids = [
+                snmp.get_if_oid(snmp_oid, if_port) for snmp_oid in snmp_oids
+            ]
+            try:
+                snmp_data = self.__get_many(oids)
+            except Exception as err:
+                logger.error(error_msg + " %s", err)
+            else:
+                result = [variable.value for variable in snmp_data]
+                received = time.monotonic()
+                for oid, value in zip(oids, result):
+                    self.__responses[oid] = (received, value)
+        else:
+            logger.error(
+                "No interface or given interface number is incorrect."
+            )
+        return result
+
+    def __get_if_indexes(self, number: int) -> List[int]:
         """
         A unique value, greater than zero, for each interface. It is
         recommended that values are assigned contiguously starting from 1. The
         value for each interface sub-layer must remain constant at least from
         one re-initialization of the entity's network management system to the
         next re-initialization.
+
+        If denseindexes is set, indexes are taken to be 1..number
+        without walking the ifIndex column. Returns None if the walk fails.
+
+        params:
+            | number: {int} - number of interfaces
         """
 
+        if self.__denseindexes:
+            return list(range(1, number + 1))
         try:
-            interfaces = self.__session.walk(snmp.OIDS["IF_INDEX"])
+            interfaces = self.__walk(snmp.OIDS["IF_INDEX"])
         except Exception as err:
-            logging.error("Could not get list of interface indexes.")
-            logging.error(err)
+            logger.error("Could not get list of interface indexes. %s", err)
         else:
             return [int(interface.value) for interface in interfaces]
 
-    def __get_if_number(self) -> str:
+    def __get_if_types(self) -> List[str]:
         """
-        The number of network interfaces (regardless of their current state)
-        present on this system.
+        Returns list of interface types.
+
+        The whole ifType column is received at once
+        and duplicate types are dropped keeping the order.
         """
 
-        return self.__get_sys_data(
-            "IF_NUMBER",
-            "Could not get number of interfaces."
+        values = self.__get_if_column(
+            "IF_TYPE",
+            "Could not get interface types."
         )
+        return list(dict.fromkeys(
+            snmp.IF_TYPES.get(value, "unknown") for value in values.values()
+        ))
 
-    def __get_if_types(self) -> List[str]:
+    def __get_many(self, oids: List[str]) -> list:
         """
-        Returns list of interface types.
+        Receives values of the OIDs with as few requests as possible.
+
+        Each request carries up to __MAX_OIDS variables, so the response
+        still fits into a single PDU the device is able to send.
         """
 
+        size = NetDevice.__MAX_OIDS
+        if len(oids) <= size:
+            return self.__session.get(oids)
         result = []
-        for index in self.__indexes:
-            if_type = self.get_if_type(index)
-            if if_type not in result:
-                result.append(if_type)
+        for start in range(0, len(oids), size):
+            result.extend(self.__session.get(oids[start:start + size]))
         return result
 
-    def __get_location(self) -> str:
+    def __get_sys_data(
+        self,
+        snmp_oids: List[str],
+        error_msg: str
+    ) -> List[str]:
         """
-        The physical location of this node
-        (e.g., "telephone closet, 3rd floor").
+        Function used in receiving device related information.
+
+        All values are requested with a single SNMP request.
         """
 
-        return self.__get_sys_data(
-            "SYS_LOCATION",
-            "Could not get device location."
-        )
+        try:
+            snmp_data = self.__session.get(
+                [snmp.OIDS[snmp_oid] for snmp_oid in snmp_oids]
+            )
+        except Exception as err:
+            logger.error(error_msg + " %s", err)
+            return [None] * len(snmp_oids)
+        else:
+            return [variable.value for variable in snmp_data]
 
-    def __get_name(self) -> str:
+    def __ensure_connected(self) -> bool:
         """
-        An administratively-assigned name for this managed node. By convention,
-        this is the node's fully-qualified domain name.
+        Connects to the device on first use, so getters
+        can be called without calling connect beforehand.
+
+        Device disconnected by disconnect is not connected again.
         """
 
-        return self.__get_sys_data(
-            "SYS_NAME",
-            "Could not get device name."
-        )
+        if self.__session is not None:
+            return True
+        if self.__disconnected:
+            logger.error("Device %s is disconnected.", self.__address)
+            return False
+        return self.connect()
 
-    def __get_sys_data(self, snmp_oid: str, error_msg: str) -> str:
+    def __load_cache(self) -> bool:
         """
-        Function used in receiving device related information.
+        Loads interface indexes and types saved by previous connections.
+
+        Saved data is ignored if it is older than __CACHE_TTL seconds or
+        number of interfaces on the device has changed since then.
         """
 
+        if not self.__cachedir:
+            return False
         try:
-            snmp_data = self.__session.get(
-                snmp.OIDS[snmp_oid]
-            )
-        except Exception as err:
-            logging.error(error_msg)
-            logging.error(err)
-        else:
-            return snmp_data.value
+            with open(self.__get_cache_path()) as cache:
+                data = json.load(cache)
+            if (
+                time.time() - data["time"] > NetDevice.__CACHE_TTL or
+                len(data["indexes"]) != self.__number
+            ):
+                return False
+            self.__indexes = data["indexes"]
+            self.__indexes_set = frozenset(self.__indexes)
+            self.__types = data["types"]
+            return True
+        except (OSError, ValueError, KeyError, TypeError):
+            return False
 
-    def __get_uptime(self) -> str:
-        """
-        The time (in hundredths of a second) since the network management
-        portion of the system was last re-initialized.
+    def __populate(self, cached: bool = False) -> bool:
         """
+        Populates device fields with necessary data.
 
-        value = self.__get_sys_data(
-            "SYS_UPTIME",
-            "Could not get device uptime."
+        Returns False if the device information could not be received.
+
+        params:
+            | cached: {bool} - use saved interface data {default: False}
+        """
+
+        self.__responses.clear()
+        (
+            number,
+            contact,
+            description,
+            location,
+            name,
+            uptime
+        ) = self.__get_sys_data(
+            [
+                "IF_NUMBER",
+                "SYS_CONTACT",
+                "SYS_DECRIPTION",
+                "SYS_LOCATION",
+                "SYS_NAME",
+                "SYS_UPTIME"
+            ],
+            "Could not get device information."
         )
-        # Value is the time (in hundredths of a second) since the
-        # network management portion of the system was last re-initialized
-        return str(timedelta(seconds=(int(value)) / 100))
+        # Values are None if the request has failed and it is already logged
+        if number is None:
+            return False
+        try:
+            number = int(number)
+            # Value is the time (in hundredths of a second) since the network
+            # management portion of the system was last re-initialized
+            uptime = int(uptime)
+        except (TypeError, ValueError):
+            logger.error(
+                "Uptime or number of interfaces is not in digital format."
+            )
+            return False
+        self.__number = number
+        self.__uptime = uptime
+        self.__contact = contact
+        self.__description = description
+        self.__location = location
+        self.__name = name
+        if not (cached and self.__load_cache()):
+            indexes = self.__get_if_indexes(number)
+            # Indexes are None if the walk has failed and it is already logged
+            if indexes is None:
+                return False
+            self.__indexes = indexes
+            self.__indexes_set = frozenset(indexes)
+            self.__types = self.__get_if_types()
+            self.__save_cache()
+        return True
+
+    def __release_session(self, healthy: bool = True) -> None:
+        """
+        Returns SNMP session to the shared pool.
+
+        Session which is not healthy is dropped by the pool. Session which
+        may still be used by a running autoupdate is dropped as well,
+        so another device can not get it while it is in use.
+        """
+
+        session = self.__session
+        if session is not None:
+            self.__session = None
+            if self.__repeat is not None and self.__repeat.running:
+                healthy = False
+            pool.SESSIONS.release(session, healthy)
+
+    def __save_cache(self) -> None:
+        """
+        Saves interface indexes and types for subsequent connections.
+        """
+
+        if not self.__cachedir:
+            return
+        try:
+            os.makedirs(self.__cachedir, exist_ok=True)
+            with open(self.__get_cache_path(), "w") as cache:
+                json.dump(
+                    {
+                        "time": time.time(),
+                        "indexes": self.__indexes,
+                        "types": self.__types
+                    },
+                    cache
+                )
+        except (OSError, TypeError) as err:
+            logger.error("Could not save interface data. %s", err)
 
-    def __populate(self) -> None:
+    def __update(self) -> None:
         """
-        Populates device fields with necessary data.
+        Updates device fields which change while the device is running.
+
+        System contact, description, location and name are only populated
+        on connect and refresh. Interface indexes and types are received
+        again only if the number of interfaces has changed.
+
+        Session dropped by changing connection parameters
+        or by a failed connect is opened again. Update which was already
+        running when autoupdate was disabled does nothing, so it does not
+        connect a disconnected device.
         """
 
-        self.__number = int(self.__get_if_number())
-        self.__contact = self.__get_contact()
-        self.__description = self.__get_description()
-        self.__indexes = self.__get_if_indexes()
-        self.__location = self.__get_location()
-        self.__name = self.__get_name()
-        self.__types = self.__get_if_types()
-        self.__uptime = self.__get_uptime()
+        if not self.__autoupdate or not self.__ensure_connected():
+            return
+        number, uptime = self.__get_sys_data(
+            ["IF_NUMBER", "SYS_UPTIME"],
+            "Could not get device uptime and number of interfaces."
+        )
+        # Values are None if the request has failed and it is already logged
+        if number is None:
+            return
+        try:
+            number = int(number)
+            uptime = int(uptime)
+        except (TypeError, ValueError):
+            logger.error(
+                "Uptime or number of interfaces is not in digital format."
+            )
+            return
+        self.__uptime = uptime
+        if number != self.__number:
+            indexes = self.__get_if_indexes(number)
+            # Number is left unchanged, so the next update walks again
+            if indexes is None:
+                return
+            self.__number = number
+            self.__indexes = indexes
+            self.__indexes_set = frozenset(indexes)
+            self.__types = self.__get_if_types()
+            self.__save_cache()
+
+    def __walk(self, oid: str) -> list:
+        """
+        Receives all values of the subtree.
+
+        SNMP v2 devices are walked with GETBULK requests
+        asking for repetitions rows each, SNMP v1 devices
+        with GETNEXT ones (a request per row).
+        """
+
+        if self.__version == 1:
+            return self.__session.walk(oid)
+        return self.__session.bulkwalk(
+            oid,
+            non_repeaters=0,
+            max_repetitions=self.__repetitions
+        )
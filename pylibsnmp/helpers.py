@@ -8,13 +8,29 @@ Python module with helper functions used in the project.
 
 
 from __future__ import annotations
-from typing import Callable
-from threading import Timer
+from concurrent.futures import ThreadPoolExecutor
+import heapq
+from itertools import count
+import logging
+import socket
+from typing import Callable, List, Tuple
+from threading import Condition, Event, Thread
+import time
+
+
+logger = logging.getLogger(__name__)
+
+
+# Unit types of speed, each next one is 1024 times bigger
+UNITS = ("Bits/s", "Kbits/s", "Mbits/s", "Gbits/s")
 
 
 class SetInterval():
     """
     Class for creating python alternative to JavaScript setInterval function.
+
+    Function is executed by a single thread which lives until
+    the interval is cancelled instead of a new thread on each call.
     """
 
     def __init__(self, func: Callable, sec: int) -> None:
@@ -26,19 +42,143 @@ class SetInterval():
             | sec: {int} - interval in seconds to execute func
         """
 
+        self.__cancelled = Event()
+
         def func_wrapper() -> None:
-            self.thread = Timer(sec, func_wrapper)
-            self.thread.start()
-            func()
-        self.thread = Timer(sec, func_wrapper)
+            while not self.__cancelled.wait(sec):
+                try:
+                    func()
+                except Exception as err:
+                    logger.error(err)
+        self.thread = Thread(target=func_wrapper)
         self.thread.start()
 
     def cancel(self):
         """
-        Cancels Timer object in order for the application to end correctly.
+        Stops the thread in order for the application to end correctly.
         """
 
-        self.thread.cancel()
+        self.__cancelled.set()
+
+
+class ScheduledJob():
+    """
+    Class for functions executed by Scheduler.
+    """
+
+    def __init__(self, func: Callable, sec: int) -> None:
+        """
+        Class constructor.
+
+        params:
+            | func: {Callable} - function to execute
+            | sec: {int} - interval in seconds to execute func
+        """
+
+        self.func = func
+        self.sec = sec
+        self.cancelled = False
+        self.running = False
+
+    def cancel(self) -> None:
+        """
+        Stops subsequent executions of the function.
+        """
+
+        self.cancelled = True
+
+    def run(self) -> None:
+        """
+        Executes the function once.
+
+        Job cancelled after it was passed to a worker thread
+        is not executed.
+        """
+
+        try:
+            if not self.cancelled:
+                self.func()
+        except Exception as err:
+            logger.error(err)
+        finally:
+            self.running = False
+
+
+class Scheduler():
+    """
+    Class for executing functions at intervals
+    using one thread for all of them.
+
+    Due functions are passed to a pool of worker threads, so a slow
+    function does not delay the others. Function is skipped while its
+    previous execution is still running.
+    """
+
+    def __init__(self, workers: int = 8) -> None:
+        """
+        Class constructor.
+
+        params:
+            | workers: {int} - maximum number of threads
+              executing functions {default: 8}
+        """
+
+        self.__condition = Condition()
+        self.__counter = count()
+        self.__executor = ThreadPoolExecutor(max_workers=workers)
+        # Heap of (due time, sequence number, job) tuples
+        self.__jobs: List[Tuple[float, int, ScheduledJob]] = []
+        self.__thread = None
+
+    def add(self, func: Callable, sec: int) -> ScheduledJob:
+        """
+        Schedules function to be executed each sec seconds.
+
+        Returns job which has to be cancelled to stop executions.
+        """
+
+        job = ScheduledJob(func, sec)
+        with self.__condition:
+            self.__push(time.monotonic() + sec, job)
+            if self.__thread is None:
+                self.__thread = Thread(target=self.__run, daemon=True)
+                self.__thread.start()
+            self.__condition.notify()
+        return job
+
+    def __push(self, due: float, job: ScheduledJob) -> None:
+        """
+        Adds job to the heap of scheduled jobs.
+        """
+
+        heapq.heappush(self.__jobs, (due, next(self.__counter), job))
+
+    def __run(self) -> None:
+        """
+        Waits for the nearest job and passes it to worker threads.
+        """
+
+        with self.__condition:
+            while True:
+                if not self.__jobs:
+                    self.__condition.wait()
+                    continue
+                due, _, job = self.__jobs[0]
+                now = time.monotonic()
+                if due > now:
+                    self.__condition.wait(due - now)
+                    continue
+                heapq.heappop(self.__jobs)
+                if job.cancelled:
+                    continue
+                self.__push(max(due + job.sec, now), job)
+                if not job.running:
+                    job.running = True
+                    self.__executor.submit(job.run)
+
+
+# Scheduler shared by all network devices
+SCHEDULER = Scheduler()
 
 
 def get_bits(octets: int) -> int:
@@ -52,6 +192,30 @@ def get_bits(octets: int) -> int:
     return octets * 8
 
 
+def get_bits_per_second(
+    prev_octets: int,
+    curr_octets: int,
+    elapsed_ns: int,
+    counter_bits: int = 32
+) -> int:
+    """
+    Returns bits per second transferred between two samples of
+    an octet counter (e.g. ifInOctets).
+
+    Elapsed time has to be measured with time.monotonic_ns() when
+    taking samples, so the rate stays correct whatever the interval
+    between samples and the delay of SNMP responses are.
+
+    Counter wrap around is taken into account: 32 bit counters
+    are used by ifTable and 64 bit ones by ifXTable.
+    """
+
+    if elapsed_ns <= 0:
+        return 0
+    octets = (curr_octets - prev_octets) % (1 << counter_bits)
+    return get_bits(octets) * 1000000000 // elapsed_ns
+
+
 def get_mac_from_octets(octets: str, delimiter: str = ":") -> str:
     """
     Converts octets to mac address.
@@ -60,23 +224,19 @@ def get_mac_from_octets(octets: str, delimiter: str = ":") -> str:
     using snmp responce comes in the format of octets.
 
     In order to convert it to mac address:
-    | - get list of ascii codes of octets
-    | - convert it to bytearray
-    | - convert it to hex format
+    | - encode octets to bytes (each character is one octet)
+    | - convert first six bytes to hex format using bytes.hex
+    |   which inserts the delimiter itself
     """
 
-    step = 2
+    mac_address = octets.encode("latin-1")[:6]
+    if not delimiter:
+        return mac_address.hex().upper()
+    # Converts AABBCCDDEEFF to AABB.CCDD.EEFF
     if delimiter == ".":
-        step = 4
-    list_of_bytes = [ord(octet) for octet in list(octets)]
-    # Mac address in the format of AABBCCDDEEFF
-    mac_address = bytearray(list_of_bytes).hex().upper()
+        return mac_address.hex(delimiter, 2).upper()
     # Converts AABBCCDDEEFF to AA:BB:CC:DD:EE:FF
-    result = delimiter.join(
-        # Mac address consists of 12 symbols (0..9, a..f, A..F)
-        [mac_address[i:i+step] for i in range(0, 12, step)]
-    )
-    return result
+    return mac_address.hex(delimiter).upper()
 
 
 def get_speed(bits: int) -> int:
@@ -84,15 +244,47 @@ def get_speed(bits: int) -> int:
     Converts bits to Kbits/s, Mbits/s or Gbits/s according to the bits count.
     """
 
-    if bits >= 1024 * 1024 * 1024:
-        speed = round(bits / (1024 * 1024 * 1024), 1)
-    elif bits >= 1024 * 1024:
-        speed = round(bits / (1024 * 1024), 1)
-    elif bits >= 1024:
-        speed = round(bits / 1024, 1)
-    else:
-        speed = bits
-    return speed
+    return get_speed_unit(bits)[0]
+
+
+def get_speed_unit(bits: int) -> Tuple[int, str]:
+    """
+    Converts bits to speed and returns it together with its unit type.
+
+    Use it instead of separate get_speed and get_unit calls
+    when both values are needed for the same bits count.
+
+    Unit tier is taken from the bit length of the value:
+    every 10 bits make one step of 1024 (Bits, Kbits, Mbits, Gbits).
+    """
+
+    tier = 0
+    if bits > 0:
+        tier = min((int(bits).bit_length() - 1) // 10, len(UNITS) - 1)
+    if tier:
+        return round(bits / (1 << 10 * tier), 1), UNITS[tier]
+    return bits, UNITS[0]
+
+
+def get_time_from_ticks(ticks: int) -> str:
+    """
+    Converts time in hundredths of a second (SNMP TimeTicks)
+    to human readable format, e.g. "1 day, 2:03:04.050000".
+
+    The string is built with integer arithmetic in the same
+    format as str(timedelta) without creating a timedelta object.
+    """
+
+    seconds, hundredths = divmod(ticks, 100)
+    minutes, seconds = divmod(seconds, 60)
+    hours, minutes = divmod(minutes, 60)
+    days, hours = divmod(hours, 24)
+    result = f"{hours}:{minutes:02d}:{seconds:02d}"
+    if hundredths:
+        result += f".{hundredths:02d}0000"
+    if days:
+        result = f"{days} day{'s' if days != 1 else ''}, {result}"
+    return result
 
 
 def get_unit(bits: int) -> str:
@@ -100,15 +292,7 @@ def get_unit(bits: int) -> str:
     Returns unit type according to the bits count.
     """
 
-    if bits >= 1024 * 1024 * 1024:
-        unit = "Gbits/s"
-    elif bits >= 1024 * 1024:
-        unit = "Mbits/s"
-    elif bits >= 1024:
-        unit = "Kbits/s"
-    else:
-        unit = "Bits/s"
-    return unit
+    return get_speed_unit(bits)[1]
 
 
 def is_ip_address(address: str) -> bool:
@@ -119,18 +303,15 @@ def is_ip_address(address: str) -> bool:
     | - have four octets
     | - each octet must be from 0 to 255
     | - each octet must be in digital format
+
+    The string is parsed by socket.inet_pton implemented in C.
     """
 
-    result = address.strip().split(".")
-    if len(result) == 4:
-        for octet in range(0, 4):
-            if (
-                not result[octet].isdigit or
-                int(result[octet]) > 255 or
-                int(result[octet]) < 0
-            ):
-                return False
-        return True
+    try:
+        socket.inet_pton(socket.AF_INET, address.strip())
+    except (AttributeError, OSError):
+        return False
+    return True
 
 
 def is_port_number(port: int) -> bool:
@@ -140,6 +321,24 @@ def is_port_number(port: int) -> bool:
     Port number has to be in the range of 1 and 65535.
     """
 
-    if type(port) is int:
-        if port > 0 and port <= 65535:
-            return True
+    return type(port) is int and 0 < port <= 65535
+
+
+def is_retries_number(retries: int) -> bool:
+    """
+    Checks whether number of retries argument has an appropriate value.
+
+    Number of retries has to be a non-negative integer.
+    """
+
+    return type(retries) is int and retries >= 0
+
+
+def is_timeout(timeout: float) -> bool:
+    """
+    Checks whether timeout argument has an appropriate value.
+
+    Timeout has to be a positive number of seconds.
+    """
+
+    return type(timeout) in (int, float) and timeout > 0
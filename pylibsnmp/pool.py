@@ -0,0 +1,121 @@
+#!/usr/bin/env python3
+# -*- coding: utf-8 -*-
+
+
+"""
+Python module with SessionPool class used
+to share SNMP sessions between network devices.
+
+Opening a session creates a socket and net-snmp session state,
+so sessions of disconnected devices are kept in the pool and handed
+to the devices connecting with the same parameters later.
+"""
+
+
+from __future__ import annotations
+from collections import OrderedDict
+from threading import Lock
+from typing import List, Tuple
+from weakref import WeakKeyDictionary
+
+from easysnmp import Session
+
+
+class SessionPool:
+    """
+    Class for keeping idle SNMP sessions for reuse.
+
+    Session is used by one device at a time: it is taken
+    from the pool on connect and returned to it on disconnect.
+
+    Sessions which failed are not kept, and no more than size idle
+    sessions are kept for the same parameters. When there are more than
+    limit idle sessions in total, sessions of the parameters released
+    least recently are dropped first.
+    """
+
+    def __init__(self, size: int = 4, limit: int = 64) -> None:
+        """
+        Class constructor.
+
+        params:
+            | size: {int} - maximum number of idle sessions
+              kept for the same parameters {default: 4}
+            | limit: {int} - maximum number of idle sessions
+              kept in total {default: 64}
+        """
+
+        self.__size = size
+        self.__limit = limit
+        # Idle sessions grouped by parameters they were opened with,
+        # parameters released least recently come first
+        self.__idle: OrderedDict[Tuple, List[Session]] = OrderedDict()
+        self.__count = 0
+        # Parameters of every session opened by the pool
+        self.__keys = WeakKeyDictionary()
+        self.__lock = Lock()
+
+    def acquire(self, **params) -> Session:
+        """
+        Returns idle session opened with the same parameters
+        or opens a new one.
+
+        params:
+            | params: {dict} - keyword arguments of easysnmp Session
+        """
+
+        key = tuple(sorted(params.items()))
+        with self.__lock:
+            sessions = self.__idle.get(key)
+            if sessions:
+                self.__count -= 1
+                session = sessions.pop()
+                if not sessions:
+                    del self.__idle[key]
+                return session
+        session = Session(**params)
+        with self.__lock:
+            self.__keys[session] = key
+        return session
+
+    def clear(self) -> None:
+        """
+        Drops all idle sessions.
+        """
+
+        with self.__lock:
+            self.__idle.clear()
+            self.__count = 0
+
+    def release(self, session: Session, healthy: bool = True) -> None:
+        """
+        Returns session to the pool for subsequent connections.
+
+        Sessions opened outside of the pool are ignored. Session which
+        is not healthy (its request failed) is dropped, so the next
+        connection opens a new one.
+        """
+
+        with self.__lock:
+            key = self.__keys.get(session)
+            if key is None:
+                return
+            if not healthy:
+                del self.__keys[session]
+                return
+            sessions = self.__idle.setdefault(key, [])
+            self.__idle.move_to_end(key)
+            if len(sessions) < self.__size:
+                sessions.append(session)
+                self.__count += 1
+            # Dropped sessions are closed once nothing refers to them
+            while self.__count > self.__limit:
+                oldest_key, oldest = next(iter(self.__idle.items()))
+                oldest.pop(0)
+                self.__count -= 1
+                if not oldest:
+                    del self.__idle[oldest_key]
+
+
+# Pool shared by all network devices
+SESSIONS = SessionPool()
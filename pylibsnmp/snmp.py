@@ -3,6 +3,7 @@
 
 
 from __future__ import annotations
+from functools import lru_cache
 from typing import Dict
 
 
@@ -365,3 +366,15 @@ IF_TYPES: Dict[str, str] = {
     "302":  "roe",
     "303":  "p2pOverLan"
 }
+
+
+@lru_cache(maxsize=4096)
+def get_if_oid(snmp_oid: str, port: int) -> str:
+    """
+    Returns OID of the interface related object (e.g. ifInOctets.1).
+
+    OIDs are built once and reused by subsequent calls
+    instead of concatenating strings on every request.
+    """
+
+    return OIDS[snmp_oid] + str(port)
@@ -0,0 +1,106 @@
+#!/usr/bin/env python3
+# -*- coding: utf-8 -*-
+
+
+import sys
+from types import ModuleType, SimpleNamespace
+
+import pytest
+
+try:
+    import easysnmp  # noqa: F401
+except ImportError:
+    # Modules importing easysnmp can be tested without net-snmp installed,
+    # sessions are replaced with FakeSession by the fixture below
+    sys.modules["easysnmp"] = ModuleType("easysnmp")
+    sys.modules["easysnmp"].Session = object
+
+from pylibsnmp import pool
+
+
+# Address of the device which does not respond (TEST-NET-1)
+UNREACHABLE = "192.0.2.1"
+# Address of the device which answers GET requests only
+NO_WALK = "192.0.2.2"
+
+
+class FakeSession:
+    """
+    Session answering requests from the values dictionary.
+    """
+
+    def __init__(self, values: dict, **params) -> None:
+        self.values = values
+        self.params = params
+        self.fail = params.get("hostname") == UNREACHABLE
+        self.fail_walk = self.fail or params.get("hostname") == NO_WALK
+        self.requests = []
+
+    def __variable(self, oid: str) -> SimpleNamespace:
+        prefix, _, index = oid.rpartition(".")
+        return SimpleNamespace(
+            oid=prefix,
+            oid_index=index,
+            value=self.values.get(oid, "NOSUCHINSTANCE")
+        )
+
+    def get(self, oids):
+        self.requests.append(oids)
+        if self.fail:
+            raise Exception("timeout")
+        if isinstance(oids, list):
+            return [self.__variable(oid) for oid in oids]
+        return self.__variable(oids)
+
+    def walk(self, oid: str) -> list:
+        self.requests.append(oid)
+        if self.fail_walk:
+            raise Exception("timeout")
+        return [
+            self.__variable(key) for key in self.values
+            if key.startswith(oid + ".")
+        ]
+
+    def bulkwalk(self, oid: str, non_repeaters=0, max_repetitions=10):
+        return self.walk(oid)
+
+
+@pytest.fixture
+def sessions(monkeypatch):
+    """
+    Replaces SNMP sessions with FakeSession answering from a switch
+    with two interfaces and returns the list of opened sessions.
+
+    Sessions to UNREACHABLE address fail every request,
+    sessions to NO_WALK address fail walks.
+    """
+
+    values = {
+        "1.3.6.1.2.1.1.1.0": "Switch",
+        "1.3.6.1.2.1.1.3.0": "12345",
+        "1.3.6.1.2.1.1.4.0": "admin",
+        "1.3.6.1.2.1.1.5.0": "sw1",
+        "1.3.6.1.2.1.1.6.0": "rack",
+        "1.3.6.1.2.1.2.1.0": "2",
+        "1.3.6.1.2.1.2.2.1.1.1": "1",
+        "1.3.6.1.2.1.2.2.1.1.2": "2",
+        "1.3.6.1.2.1.2.2.1.3.1": "6",
+        "1.3.6.1.2.1.2.2.1.3.2": "6",
+        "1.3.6.1.2.1.2.2.1.4.1": "1500",
+        "1.3.6.1.2.1.2.2.1.4.2": "9000",
+        "1.3.6.1.2.1.2.2.1.5.1": "1000000000",
+        "1.3.6.1.2.1.2.2.1.10.1": "100",
+        "1.3.6.1.2.1.2.2.1.10.2": "200",
+        "1.3.6.1.2.1.2.2.1.16.1": "300",
+        "1.3.6.1.2.1.2.2.1.16.2": "400"
+    }
+    opened = []
+
+    def open_session(**params):
+        session = FakeSession(values, **params)
+        opened.append(session)
+        return session
+
+    monkeypatch.setattr(pool, "Session", open_session)
+    monkeypatch.setattr(pool, "SESSIONS", pool.SessionPool())
+    return opened
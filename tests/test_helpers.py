@@ -2,14 +2,56 @@
 # -*- coding: utf-8 -*-
 
 
+from threading import Event
+import time
+
 from pylibsnmp import helpers
 
 
 class TestHelpers:
+    def test_set_interval(self):
+        called = Event()
+        interval = helpers.SetInterval(called.set, 0.01)
+        assert called.wait(1)
+        interval.cancel()
+        interval.thread.join(1)
+        assert not interval.thread.is_alive()
+
+    def test_scheduler(self):
+        called = Event()
+        # Shared scheduler is used to avoid leaving extra threads behind
+        job = helpers.SCHEDULER.add(called.set, 0.01)
+        assert called.wait(1)
+        job.cancel()
+        # Execution submitted right before cancel may still complete
+        time.sleep(0.05)
+        called.clear()
+        assert not called.wait(0.1)
+
+    def test_scheduled_job_cancelled(self):
+        called = Event()
+        job = helpers.ScheduledJob(called.set, 1)
+        job.running = True
+        job.cancel()
+        job.run()
+        assert not called.is_set()
+        assert not job.running
+
     def test_get_bits(self):
         result = helpers.get_bits(8)
         assert result == 64
 
+    def test_get_bits_per_second(self):
+        assert helpers.get_bits_per_second(0, 125, 1000000000) == 1000
+        assert helpers.get_bits_per_second(0, 125, 500000000) == 2000
+        result = helpers.get_bits_per_second(2 ** 32 - 25, 100, 1000000000)
+        assert result == 1000
+        result = helpers.get_bits_per_second(
+            2 ** 64 - 25, 100, 1000000000, 64
+        )
+        assert result == 1000
+        assert helpers.get_bits_per_second(0, 125, 0) == 0
+
     def test_get_mac_from_octets(self):
         result = helpers.get_mac_from_octets("ÔÊmhçn")
         assert not result == "AA:BB:CC:DD:EE:FF"
@@ -18,6 +60,8 @@ class TestHelpers:
         assert result == "D4-CA-6D-68-E7-6E"
         result = helpers.get_mac_from_octets("ÔÊmhçn", ".")
         assert result == "D4CA.6D68.E76E"
+        result = helpers.get_mac_from_octets("ÔÊmhçn", "")
+        assert result == "D4CA6D68E76E"
 
     def test_get_speed(self):
         assert helpers.get_speed(1073741824) == 1.0
@@ -28,6 +72,24 @@ class TestHelpers:
         assert helpers.get_speed(123456) == 120.6
         assert helpers.get_speed(500) == 500
 
+    def test_get_speed_unit(self):
+        assert helpers.get_speed_unit(12345678910) == (11.5, "Gbits/s")
+        assert helpers.get_speed_unit(123456789) == (117.7, "Mbits/s")
+        assert helpers.get_speed_unit(123456) == (120.6, "Kbits/s")
+        assert helpers.get_speed_unit(500) == (500, "Bits/s")
+        assert helpers.get_speed_unit(1023) == (1023, "Bits/s")
+        assert helpers.get_speed_unit(0) == (0, "Bits/s")
+        assert helpers.get_speed_unit(2 ** 42) == (4096.0, "Gbits/s")
+
+    def test_get_time_from_ticks(self):
+        assert helpers.get_time_from_ticks(0) == "0:00:00"
+        assert helpers.get_time_from_ticks(12345) == "0:02:03.450000"
+        assert helpers.get_time_from_ticks(8640000) == "1 day, 0:00:00"
+        result = helpers.get_time_from_ticks(18000001)
+        assert result == "2 days, 2:00:00.010000"
+        result = helpers.get_time_from_ticks(4294967295)
+        assert result == "497 days, 2:27:52.950000"
+
     def test_get_unit(self):
         assert helpers.get_unit(1073741824) == "Gbits/s"
         assert helpers.get_unit(1073742324) == "Gbits/s"
@@ -42,3 +104,30 @@ class TestHelpers:
         assert helpers.is_ip_address("255.255.255.255")
         assert helpers.is_ip_address("192.168.0.255")
         assert not helpers.is_ip_address("192.168.0.256")
+        assert helpers.is_ip_address(" 10.0.0.1 ")
+        assert not helpers.is_ip_address("10.0.0")
+        assert not helpers.is_ip_address("a.b.c.d")
+        assert not helpers.is_ip_address("")
+        assert not helpers.is_ip_address(None)
+
+    def test_is_port_number(self):
+        assert helpers.is_port_number(1)
+        assert helpers.is_port_number(161)
+        assert helpers.is_port_number(65535)
+        assert not helpers.is_port_number(0)
+        assert not helpers.is_port_number(65536)
+        assert not helpers.is_port_number("161")
+        assert not helpers.is_port_number(True)
+
+    def test_is_retries_number(self):
+        assert helpers.is_retries_number(0)
+        assert helpers.is_retries_number(3)
+        assert not helpers.is_retries_number(-1)
+        assert not helpers.is_retries_number(1.0)
+
+    def test_is_timeout(self):
+        assert helpers.is_timeout(1)
+        assert helpers.is_timeout(0.5)
+        assert not helpers.is_timeout(0)
+        assert not helpers.is_timeout(-1)
+        assert not helpers.is_timeout("1")
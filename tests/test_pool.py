@@ -0,0 +1,74 @@
+#!/usr/bin/env python3
+# -*- coding: utf-8 -*-
+
+
+from pylibsnmp import pool
+
+
+class TestSessionPool:
+    def test_acquire_reuses_released_session(self, sessions):
+        session_pool = pool.SessionPool()
+        session = session_pool.acquire(hostname="10.0.0.1", version=2)
+        session_pool.release(session)
+        assert session_pool.acquire(version=2, hostname="10.0.0.1") is session
+        assert len(sessions) == 1
+
+    def test_acquire_opens_session_for_other_parameters(self, sessions):
+        session_pool = pool.SessionPool()
+        session = session_pool.acquire(hostname="10.0.0.1")
+        session_pool.release(session)
+        assert session_pool.acquire(hostname="10.0.0.2") is not session
+        assert len(sessions) == 2
+
+    def test_acquire_does_not_share_session_in_use(self, sessions):
+        session_pool = pool.SessionPool()
+        first = session_pool.acquire(hostname="10.0.0.1")
+        second = session_pool.acquire(hostname="10.0.0.1")
+        assert first is not second
+
+    def test_release_keeps_at_most_size_sessions(self, sessions):
+        session_pool = pool.SessionPool(size=1)
+        first = session_pool.acquire(hostname="10.0.0.1")
+        second = session_pool.acquire(hostname="10.0.0.1")
+        session_pool.release(first)
+        session_pool.release(second)
+        assert session_pool.acquire(hostname="10.0.0.1") is first
+        third = session_pool.acquire(hostname="10.0.0.1")
+        assert third is not second
+        assert len(sessions) == 3
+
+    def test_release_keeps_at_most_limit_sessions(self, sessions):
+        session_pool = pool.SessionPool(limit=2)
+        first = session_pool.acquire(hostname="10.0.0.1")
+        second = session_pool.acquire(hostname="10.0.0.2")
+        third = session_pool.acquire(hostname="10.0.0.3")
+        session_pool.release(first)
+        session_pool.release(second)
+        # Session released least recently is dropped
+        session_pool.release(third)
+        assert session_pool.acquire(hostname="10.0.0.1") is not first
+        assert session_pool.acquire(hostname="10.0.0.2") is second
+        assert session_pool.acquire(hostname="10.0.0.3") is third
+
+    def test_release_drops_unhealthy_session(self, sessions):
+        session_pool = pool.SessionPool()
+        session = session_pool.acquire(hostname="10.0.0.1")
+        session_pool.release(session, healthy=False)
+        assert session_pool.acquire(hostname="10.0.0.1") is not session
+        # Dropped session is unknown to the pool from now on
+        session_pool.release(session)
+        assert len(sessions) == 2
+        assert session_pool.acquire(hostname="10.0.0.1") is not session
+
+    def test_release_ignores_foreign_session(self, sessions):
+        session_pool = pool.SessionPool()
+        foreign = pool.Session(hostname="10.0.0.1")
+        session_pool.release(foreign)
+        assert session_pool.acquire(hostname="10.0.0.1") is not foreign
+
+    def test_clear(self, sessions):
+        session_pool = pool.SessionPool()
+        session = session_pool.acquire(hostname="10.0.0.1")
+        session_pool.release(session)
+        session_pool.clear()
+        assert session_pool.acquire(hostname="10.0.0.1") is not session
@@ -2,8 +2,57 @@
 # -*- coding: utf-8 -*-
 
 
-# from pylibsnmp import device
+from pylibsnmp import device
 
 
 class TestPrivateMethods:
-    pass
+    def test_get_many_splits_requests(self, sessions):
+        net_device = device.NetDevice("10.0.0.1")
+        net_device.connect()
+        oids = ["1.3.6.1.2.1.2.2.1.4.1"] * 130
+        result = net_device._NetDevice__get_many(oids)
+        assert len(result) == 130
+        sizes = [len(request) for request in sessions[0].requests[-3:]]
+        assert sizes == [60, 60, 10]
+
+    def test_get_if_indexes_dense(self, sessions):
+        net_device = device.NetDevice("10.0.0.1")
+        net_device.denseindexes = True
+        net_device.connect()
+        assert net_device.indexes == [1, 2]
+        assert "1.3.6.1.2.1.2.2.1.1" not in sessions[0].requests
+
+    def test_update_reconnects(self, sessions):
+        net_device = device.NetDevice("10.0.0.1")
+        net_device.connect()
+        net_device.autoupdate = True
+        net_device.address = "10.0.0.2"
+        net_device._NetDevice__update()
+        assert sessions[-1].params["hostname"] == "10.0.0.2"
+        assert net_device.uptime == "0:02:03.450000"
+        net_device.disconnect()
+
+    def test_update_after_disconnect(self, sessions):
+        net_device = device.NetDevice("10.0.0.1")
+        net_device.connect()
+        net_device.autoupdate = True
+        net_device.disconnect()
+        net_device._NetDevice__update()
+        assert net_device._NetDevice__session is None
+        assert len(sessions) == 1
+
+    def test_update_retries_failed_walk(self, sessions):
+        net_device = device.NetDevice("10.0.0.1")
+        net_device.connect()
+        sessions[0].values["1.3.6.1.2.1.2.1.0"] = "3"
+        sessions[0].values["1.3.6.1.2.1.2.2.1.1.3"] = "3"
+        net_device.autoupdate = True
+        sessions[0].fail_walk = True
+        net_device._NetDevice__update()
+        assert net_device.number == 2
+        assert net_device.indexes == [1, 2]
+        sessions[0].fail_walk = False
+        net_device._NetDevice__update()
+        assert net_device.number == 3
+        assert net_device.indexes == [1, 2, 3]
+        net_device.disconnect()
@@ -2,8 +2,186 @@
 # -*- coding: utf-8 -*-
 
 
-# from pylibsnmp import helpers
+import logging
+
+from pylibsnmp import device, pool
+
+from .conftest import NO_WALK, UNREACHABLE
 
 
 class TestPublicMethods:
-    pass
+    def test_connect(self, sessions):
+        net_device = device.NetDevice("10.0.0.1")
+        assert net_device.connect()
+        assert net_device.name == "sw1"
+        assert net_device.contact == "admin"
+        assert net_device.number == 2
+        assert net_device.indexes == [1, 2]
+        assert net_device.types == ["ethernet-csmacd"]
+        assert net_device.uptime == "0:02:03.450000"
+        # Session is reused by subsequent connects
+        assert net_device.connect()
+        assert len(sessions) == 1
+
+    def test_connect_passes_session_parameters(self, sessions):
+        net_device = device.NetDevice(
+            " 10.0.0.1 ", " private ", 1161, 1, timeout=2, retries=0
+        )
+        net_device.connect()
+        params = sessions[0].params
+        assert params["hostname"] == "10.0.0.1"
+        assert params["community"] == "private"
+        assert params["remote_port"] == 1161
+        assert params["version"] == 1
+        assert params["timeout"] == 2
+        assert params["retries"] == 0
+
+    def test_connect_unreachable(self, sessions, caplog):
+        net_device = device.NetDevice(UNREACHABLE)
+        with caplog.at_level(logging.ERROR):
+            assert not net_device.connect()
+        # Only the SNMP error itself is logged
+        assert len(caplog.records) == 1
+        assert "timeout" in caplog.records[0].getMessage()
+        # Failed session is not reused
+        net_device.connect()
+        assert len(sessions) == 2
+
+    def test_connect_walk_fails(self, sessions):
+        net_device = device.NetDevice(NO_WALK)
+        assert not net_device.connect()
+        assert net_device.indexes == []
+
+    def test_disconnect_returns_session_to_pool(self, sessions):
+        first = device.NetDevice("10.0.0.1")
+        first.connect()
+        first.disconnect()
+        second = device.NetDevice("10.0.0.1")
+        second.connect()
+        assert len(sessions) == 1
+
+    def test_getter_after_disconnect(self, sessions):
+        net_device = device.NetDevice("10.0.0.1")
+        net_device.connect()
+        net_device.disconnect()
+        assert net_device.get_if_mtu(1) is None
+        assert not net_device.refresh()
+        assert net_device._NetDevice__session is None
+        # Device is connected again only by connect
+        assert net_device.connect()
+        assert net_device.get_if_mtu(1) == "1500"
+
+    def test_getter_connects_lazily(self, sessions):
+        net_device = device.NetDevice("10.0.0.1")
+        assert net_device.get_if_mtu(2) == "9000"
+        assert len(sessions) == 1
+
+    def test_getter_reuses_received_value(self, sessions):
+        net_device = device.NetDevice("10.0.0.1")
+        net_device.cachetime = 60
+        net_device.get_if_mtu(1)
+        requests = len(sessions[0].requests)
+        assert net_device.get_if_mtu(1) == "1500"
+        assert len(sessions[0].requests) == requests
+        net_device.cachetime = 0
+        net_device.get_if_mtu(1)
+        assert len(sessions[0].requests) == requests + 1
+
+    def test_getter_unknown_port(self, sessions):
+        net_device = device.NetDevice("10.0.0.1")
+        assert net_device.get_if_mtu(3) is None
+
+    def test_get_if_speed(self, sessions):
+        net_device = device.NetDevice("10.0.0.1")
+        assert net_device.get_if_speed_bps(1) == 1000000000
+        assert net_device.get_if_speed(1) == "1000"
+        # Value of interface 2 is missing
+        assert net_device.get_if_speed_bps(2) is None
+
+    def test_get_if_bulk(self, sessions):
+        net_device = device.NetDevice("10.0.0.1")
+        result = net_device.get_if_bulk([1, 2, 3], "IF_MTU")
+        assert result == {1: "1500", 2: "9000"}
+        assert net_device.get_if_bulk([1], "UNKNOWN") == {}
+
+    def test_get_if_octets(self, sessions):
+        net_device = device.NetDevice("10.0.0.1")
+        assert net_device.get_if_octets(2) == ("200", "400")
+
+    def test_get_if_stats(self, sessions):
+        net_device = device.NetDevice("10.0.0.1")
+        result = net_device.get_if_stats(1, ["IF_MTU", "IF_IN_OCTETS"])
+        assert result == {"IF_MTU": "1500", "IF_IN_OCTETS": "100"}
+        result = net_device.get_if_stats(1, ["IF_MTU", "UNKNOWN"])
+        assert result == {"IF_MTU": None, "UNKNOWN": None}
+
+    def test_get_if_table(self, sessions):
+        net_device = device.NetDevice("10.0.0.1")
+        result = net_device.get_if_table(["IF_MTU", "UNKNOWN"])
+        assert result == {1: {"IF_MTU": "1500"}, 2: {"IF_MTU": "9000"}}
+
+    def test_get_if_counters(self, sessions):
+        net_device = device.NetDevice("10.0.0.1")
+        result = net_device.get_if_counters(["IF_IN_OCTETS", "UNKNOWN"])
+        assert list(result) == ["IF_IN_OCTETS"]
+        assert list(result["IF_IN_OCTETS"]) == [100, 200]
+        sessions[0].fail_walk = True
+        assert net_device.get_if_counters(["IF_IN_OCTETS"]) == {}
+
+    def test_refresh_many(self, sessions):
+        devices = [device.NetDevice("10.0.0.1"), device.NetDevice(UNREACHABLE)]
+        assert device.NetDevice.refresh_many(devices) == [True, False]
+
+    def test_refresh_walk_fails(self, sessions):
+        devices = [device.NetDevice("10.0.0.1"), device.NetDevice("10.0.0.1")]
+        for net_device in devices:
+            net_device.connect()
+        sessions[1].fail_walk = True
+        assert not devices[1].refresh()
+        assert device.NetDevice.refresh_many(devices) == [True, False]
+
+    def test_cachedir(self, sessions, tmp_path):
+        first = device.NetDevice("10.0.0.1")
+        first.cachedir = str(tmp_path)
+        first.connect()
+        second = device.NetDevice("10.0.0.1")
+        second.cachedir = str(tmp_path)
+        second.connect()
+        # Indexes and types are loaded from disk instead of walking them
+        assert second.indexes == [1, 2]
+        assert second.types == ["ethernet-csmacd"]
+        walks = [
+            request for request in sessions[0].requests
+            if isinstance(request, str)
+        ]
+        assert len(walks) == 2
+
+    def test_setters_reject_invalid_values(self, sessions):
+        net_device = device.NetDevice("10.0.0.1")
+        net_device.port = 1161
+        assert net_device.port == 1161
+        assert net_device.version == 2
+        net_device.version = [1]
+        assert net_device.version == 2
+        assert device.NetDevice("10.0.0.1", version=[1]).version == 2
+        net_device.updatetime = True
+        assert net_device.updatetime == 60
+        net_device.cachetime = True
+        assert net_device.cachetime == 0.1
+        net_device.cachetime = 1.5
+        assert net_device.cachetime == 1.5
+        net_device.repetitions = True
+        assert net_device.repetitions == 25
+        net_device.denseindexes = "no"
+        assert not net_device.denseindexes
+        net_device.community = " "
+        assert net_device.community == "public"
+
+    def test_parameter_change_drops_session(self, sessions):
+        net_device = device.NetDevice("10.0.0.1")
+        net_device.connect()
+        net_device.address = "10.0.0.2"
+        net_device.connect()
+        assert sessions[1].params["hostname"] == "10.0.0.2"
+        # Previous session is back in the pool
+        assert pool.SESSIONS.acquire(**sessions[0].params) is sessions[0]